@@ -0,0 +1,48 @@
+""" A benchmark of `to_datetime(..., threads=N)` across thread counts.
+
+Usage:
+    PYTHONPATH=. python benchmarks/thread_scaling.py [--size SIZE] [--max-threads N]
+
+Run it from the repository root, or install the package first by `pip install -e .`.
+
+On a free-threaded build (e.g. python3.13t) run with PYTHON_GIL=0 to see parallel scaling.
+
+"""
+
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+import sys
+import time
+
+import jadtparser
+
+
+def _make_texts(size: int) -> list[str]:
+    start = datetime(2022, 1, 1)
+    fmt = "%Y年%m月%d日%H時%M分%S秒"
+    return [(start + timedelta(seconds=7 * i)).strftime(fmt) for i in range(size)]
+
+
+def main() -> None:
+    arg_parser = ArgumentParser()
+    arg_parser.add_argument("--size", type=int, default=200_000)
+    arg_parser.add_argument("--max-threads", type=int, default=8)
+    args = arg_parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]}, GIL enabled: {gil_enabled}, size: {args.size}")
+
+    texts = _make_texts(args.size)
+    baseline = None
+    threads = 1
+    while threads <= args.max_threads:
+        t0 = time.perf_counter()
+        jadtparser.to_datetime(texts, threads=threads)
+        elapsed = time.perf_counter() - t0
+        baseline = baseline or elapsed
+        print(f"threads={threads:>3}: {elapsed:.3f}s (x{baseline / elapsed:.2f})")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
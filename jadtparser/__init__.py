@@ -1,3 +1,6 @@
 from .parser import *  # noqa
 from .type_converter import *  # noqa
-from .operator import *  # noqa
\ No newline at end of file
+from .operator import *  # noqa
+from .column import *  # noqa
+from .cache import *  # noqa
+from .index import *  # noqa
\ No newline at end of file
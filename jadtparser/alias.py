@@ -2,15 +2,18 @@
 
 """
 
+from collections.abc import Sequence
 from datetime import datetime, date, time
 from typing import Iterable
 
+from .column import DatetimeColumn
+
 
 # ********************
 # typing
 # ********************
 
 StrOrIterable = str | Iterable[str]
-DatetimeOrList = datetime | list[datetime]
-DateOrList = date | list[date]
-TimeOrList = time | list[time]
+DatetimeOrList = datetime | list[datetime] | DatetimeColumn
+DateOrList = date | list[date] | Sequence[date]
+TimeOrList = time | list[time] | Sequence[time]
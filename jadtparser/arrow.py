@@ -0,0 +1,252 @@
+""" The module which offers a columnar parsing path for Apache Arrow arrays and Parquet files.
+
+This module requires pyarrow: `pip install ja-date-parser[arrow]`
+
+"""
+
+from collections.abc import Iterable, Iterator
+import dateutil.tz
+import re
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as e:  # pragma: no cover
+    raise ImportError("jadtparser.arrow requires pyarrow: pip install ja-date-parser[arrow]") from e
+
+from .parser import infer_dateformat_ja_all
+from .type_converter import to_datetime
+
+# ********************
+# constants
+# ********************
+_DEFAULT_SAMPLE_SIZE = 1000
+_DEFAULT_BATCH_SIZE = 65536
+_DIRECTIVE_SPLIT_PATTERN = re.compile(r"(%[YmdHMSf%])")
+# pyarrow.compute.strptime rolls over out-of-range days and seconds (e.g. 2/30 -> 3/2), so they are verified
+_ROLLOVER_FIELDS = {"d": pc.day, "S": pc.second}
+# pyarrow.compute.strptime also accepts short years, so %Y is matched only by 4 digits as CompiledFormat
+_DIRECTIVE_DIGITS = {"Y": "[0-9]{4}"}
+
+
+# ********************
+# private functions
+# ********************
+
+
+def _timestamp_type(tz_name: str | None) -> pa.DataType:
+    return pa.timestamp("us", tz=tz_name)
+
+
+def _infer_format(dictionary: pa.Array, sample_size: int) -> str | None:
+    sample = dictionary.drop_null()
+    if len(sample) > sample_size:
+        sample = sample.slice(0, sample_size)
+
+    try:
+        inferred_formats = infer_dateformat_ja_all(sample.to_pylist())
+    except ValueError:
+        return None  # Imply not Japanese or invalid format
+
+    if len(inferred_formats) != 1:
+        return None
+    return inferred_formats[0]
+
+
+def _parse_python(array: pa.Array, dictionary: pa.Array, tz_name: str | None) -> pa.Array:
+    # Parse each distinct text once and fan the results out by indices
+    tz_obj = dateutil.tz.gettz(tz_name) if tz_name is not None else dateutil.tz.UTC
+    parsed = list()
+    for text in dictionary.to_pylist():
+        if text is None:
+            parsed.append(None)
+            continue
+        dt = to_datetime(text)
+        if dt.tzinfo is not None:  # type: ignore
+            dt = dt.astimezone(tz_obj).replace(tzinfo=None)  # type: ignore
+        parsed.append(dt)
+
+    parsed_dictionary = pa.array(parsed, type=pa.timestamp("us"))
+    indices = pc.index_in(array, value_set=dictionary)
+    return pc.take(parsed_dictionary, indices)
+
+
+def _make_extract_pattern(fmt: str) -> str:
+    pattern = ""
+    for part in _DIRECTIVE_SPLIT_PATTERN.split(fmt):
+        if part == "%%":
+            pattern += "%"
+        elif part.startswith("%"):
+            directive = part[1:]
+            group = f"?P<{directive}>" if directive in _ROLLOVER_FIELDS else "?:"
+            pattern += f"({group}{_DIRECTIVE_DIGITS.get(directive, '[0-9]+')})"
+        else:
+            pattern += "".join(r"\s+" if c.isspace() else re.escape(c) for c in part)
+
+    return "^" + pattern + "$"
+
+
+def _has_invalid_fields(array: pa.Array, parsed: pa.Array, fmt: str) -> bool:
+    # Verify fields which pyarrow.compute.strptime accepts more leniently than CompiledFormat
+    extracted = pc.extract_regex(array, pattern=_make_extract_pattern(fmt))
+    if pc.any(pc.and_(pc.is_valid(array), pc.is_null(extracted))).as_py():
+        return True
+
+    for directive in [d for d in _ROLLOVER_FIELDS if "%" + d in fmt]:
+        digits = pc.cast(pc.struct_field(extracted, directive), pa.int64())
+        mismatched = pc.not_equal(digits, pc.cast(_ROLLOVER_FIELDS[directive](parsed), pa.int64()))
+        if pc.any(mismatched).as_py():
+            return True
+
+    return False
+
+
+def _parse_strings(array: pa.Array, tz_name: str | None, sample_size: int) -> pa.Array:
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        raise TypeError(f"Invalid type: {array.type}")
+
+    dictionary = pc.unique(array)
+    inferred_format = _infer_format(dictionary, sample_size)
+
+    # pyarrow.compute.strptime does not support %f
+    if inferred_format is not None and r"%f" not in inferred_format:
+        try:
+            parsed = pc.strptime(array, format=inferred_format, unit="us")
+        except pa.ArrowInvalid:
+            parsed = None  # Imply some texts are in other formats
+        if parsed is not None and not _has_invalid_fields(array, parsed, inferred_format):
+            return parsed
+
+    return _parse_python(array, dictionary, tz_name)
+
+
+def _target_schema(schema: pa.Schema, columns: list[str], tz_name: str | None) -> pa.Schema:
+    # Replace types of date fields with keeping their nullability and metadata
+    for name in columns:
+        i = schema.get_field_index(name)
+        if i < 0:
+            raise KeyError(f"Column not found: {name}")
+        schema = schema.set(i, schema.field(i).with_type(_timestamp_type(tz_name)))
+
+    return schema
+
+
+def _parse_chunk(array: pa.Array, tz_name: str | None, sample_size: int) -> pa.Array:
+    if pa.types.is_dictionary(array.type):
+        parsed_dictionary = _parse_strings(array.dictionary, tz_name, sample_size)
+        parsed = pc.take(parsed_dictionary, array.indices)
+    else:
+        parsed = _parse_strings(array, tz_name, sample_size)
+
+    if tz_name is not None:
+        parsed = pc.assume_timezone(parsed, tz_name)
+
+    return parsed
+
+
+# ********************
+# public functions
+# ********************
+
+
+def parse_column(
+    array: pa.Array | pa.ChunkedArray, tz_name: str | None = "Asia/Tokyo", sample_size: int = _DEFAULT_SAMPLE_SIZE
+) -> pa.Array | pa.ChunkedArray:
+    """Parse an Arrow string array of date-format texts in Japanese style into a timestamp array.
+
+    * A format is inferred once per chunk from its distinct values (at most `sample_size` of them).
+    * If the format is inferred, texts are parsed directly from the Arrow buffers by `pyarrow.compute.strptime`.
+    * Otherwise, each distinct text is parsed once by `to_datetime` and the results are fanned out.
+    * Nulls are preserved.
+
+    Args:
+        array (pyarrow.Array or pyarrow.ChunkedArray): A string, large_string or dictionary<string> array
+        tz_name (str or None): Time zone name of the result type. If None, then return naive timestamps.
+        sample_size (int): The maximum number of distinct texts used for inference
+
+    Returns:
+        pyarrow.Array or pyarrow.ChunkedArray: A `timestamp[us, tz]` array
+
+    Raises:
+        ValueError: If failed to parse any texts
+        TypeError: If an invalid type arg is given
+
+    """
+
+    if isinstance(array, pa.ChunkedArray):
+        chunks = [_parse_chunk(c, tz_name, sample_size) for c in array.chunks]
+        return pa.chunked_array(chunks, type=_timestamp_type(tz_name))
+    elif isinstance(array, pa.Array):
+        return _parse_chunk(array, tz_name, sample_size)
+    else:
+        raise TypeError("Invalid type")
+
+
+def iter_parquet_batches(
+    source: str,
+    columns: Iterable[str],
+    tz_name: str | None = "Asia/Tokyo",
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    sample_size: int = _DEFAULT_SAMPLE_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """Stream a Parquet file record batch by record batch with parsing date columns.
+
+    Args:
+        source (str): A path to a Parquet file
+        columns (Iterable[str]): Names of date columns to parse
+        tz_name (str or None): Time zone name of the result type. If None, then return naive timestamps.
+        batch_size (int): The maximum number of rows in each record batch
+        sample_size (int): The maximum number of distinct texts used for inference
+
+    Yields:
+        pyarrow.RecordBatch: A record batch whose date columns are parsed. Other fields keep the source schema.
+
+    Raises:
+        KeyError: If a given column does not exist
+
+    """
+
+    columns = list(columns)
+    parquet_file = pq.ParquetFile(source)
+    schema = _target_schema(parquet_file.schema_arrow, columns, tz_name)
+    indices = [schema.get_field_index(name) for name in columns]
+
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        arrays = batch.columns
+        for i in indices:
+            arrays[i] = parse_column(arrays[i], tz_name=tz_name, sample_size=sample_size)
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def rewrite_parquet(
+    source: str,
+    destination: str,
+    columns: Iterable[str],
+    tz_name: str | None = "Asia/Tokyo",
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+    sample_size: int = _DEFAULT_SAMPLE_SIZE,
+) -> None:
+    """Rewrite date columns of a Parquet file into timestamp columns.
+
+    * The file is processed record batch by record batch, so it is never loaded at once.
+
+    Args:
+        source (str): A path to a source Parquet file
+        destination (str): A path to a destination Parquet file
+        columns (Iterable[str]): Names of date columns to parse
+        tz_name (str or None): Time zone name of the result type. If None, then write naive timestamps.
+        batch_size (int): The maximum number of rows in each record batch
+        sample_size (int): The maximum number of distinct texts used for inference
+
+    Raises:
+        KeyError: If a given column does not exist
+
+    """
+
+    columns = list(columns)
+    schema = _target_schema(pq.read_schema(source), columns, tz_name)
+
+    with pq.ParquetWriter(destination, schema) as writer:
+        for batch in iter_parquet_batches(source, columns, tz_name, batch_size, sample_size):
+            writer.write_batch(batch)
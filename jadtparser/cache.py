@@ -0,0 +1,129 @@
+""" The module which offers a bounded cache of parse results.
+
+"""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any, NamedTuple
+
+# ********************
+# constants
+# ********************
+_DEFAULT_MAXSIZE = 4096
+_MISSING = object()
+
+
+# ********************
+# public classes
+# ********************
+class CacheInfo(NamedTuple):
+    """Statistics of a ParseCache
+
+    Attributes:
+        hits (int): The number of lookups which found a result
+        misses (int): The number of lookups which found no result
+        maxsize (int): The maximum number of results
+        currsize (int): The current number of results
+
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """A bounded LRU cache of parse results
+
+    * Pass an instance to `cache` args of `to_datetime`, `to_date`, `to_time`, `date_add` and `date_sub`.
+    * Results are keyed by the given text and the settings which affect the result (e.g. time zone).
+    * Each distinct text in a list is looked up once, so duplicates in a batch are parsed only once.
+
+    Args:
+        maxsize (int): The maximum number of results
+
+    Raises:
+        ValueError: If `maxsize` is not positive
+
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError(f"An invalid maxsize: {maxsize}")
+
+        self._maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self._maxsize})"
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Look up a result and count a hit or a miss
+
+        Args:
+            key (Hashable): A cache key
+            default (Any): A value returned if missing
+
+        Returns:
+            Any: The cached result or `default`
+
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result with evicting the least recently used one if full
+
+        Args:
+            key (Hashable): A cache key
+            value (Any): A result
+
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all results and reset the counters"""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return statistics of the cache
+
+        Returns:
+            CacheInfo: Hits, misses, maxsize and currsize
+
+        """
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
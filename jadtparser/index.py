@@ -0,0 +1,236 @@
+""" The module which offers a sorted time index over date-format strings in Japanese.
+
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import datetime
+
+from .column import DatetimeColumn
+from .type_converter import to_datetime
+
+# ********************
+# constants
+# ********************
+_FIXED_UNIT_MICROSECONDS = {
+    "second": 1_000_000,
+    "minute": 60 * 1_000_000,
+    "hour": 60 * 60 * 1_000_000,
+    "day": 24 * 60 * 60 * 1_000_000,
+}
+_CALENDAR_UNITS = ["month", "year"]
+
+
+# ********************
+# private functions
+# ********************
+
+
+def _truncate(dt: datetime, unit: str) -> datetime:
+    if unit == "second":
+        return dt.replace(microsecond=0)
+    elif unit == "minute":
+        return dt.replace(second=0, microsecond=0)
+    elif unit == "hour":
+        return dt.replace(minute=0, second=0, microsecond=0)
+    elif unit == "day":
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    elif unit == "month":
+        return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    elif unit == "year":
+        return dt.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    else:
+        raise ValueError(f"An invalid unit: {unit}")
+
+
+# ********************
+# public classes
+# ********************
+class TimeIndex:
+    """A sorted index of date-format texts in Japanese style for range queries
+
+    * Texts are parsed by `to_datetime` in one batch into epoch microseconds, which are kept sorted
+      together with thier original positions. Equal timestamps keep the order of positions.
+    * Queries accept date-format texts (or datetime objects) and run in O(log n) by binary search.
+    * Appended texts are inserted into the sorted arrays without rebuilding the index.
+    * If texts have zone designators, the index is aware even if `with_tz` = False.
+    * One rule applies to queries and appended texts: in an aware index, naive texts are read as local time
+      in the zone of the index, and in a naive index, aware texts are rejected by ValueError.
+
+    Args:
+        texts (Iterable[str]): Date format texts in Japanese style
+        with_tz (bool): Whether or not append timezone from `tz_name` to datetime
+        tz_name (str): Time zone name. This is valid if `with_tz` = True.
+
+    Raises:
+        ValueError: If failed to parse any texts
+
+    """
+
+    def __init__(self, texts: Iterable[str] = (), with_tz: bool = False, tz_name: str = "Asia/Tokyo"):
+        self._with_tz = with_tz
+        self._tz_name = tz_name
+
+        column = self._parse_all(texts)
+        self._codec = DatetimeColumn(tzinfo=column.tzinfo)
+        values = column.epoch_microseconds
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self._keys = array("q", (values[i] for i in order))
+        self._positions = array("q", order)
+        values.release()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)}, with_tz={self._with_tz}, tz_name={self._tz_name!r})"
+
+    # ********************
+    # conversions
+    # ********************
+    def _parse_all(self, texts: Iterable[str]) -> DatetimeColumn:
+        return to_datetime(texts, with_tz=self._with_tz, tz_name=self._tz_name, as_column=True)  # type: ignore
+
+    def _to_key(self, date: str | datetime) -> int:
+        if isinstance(date, str):
+            date = to_datetime(date, with_tz=self._with_tz, tz_name=self._tz_name)  # type: ignore
+        return self._codec.encode(date)  # type: ignore
+
+    # ********************
+    # mutations
+    # ********************
+    def append(self, text: str) -> None:
+        """Insert a text without rebuilding the index
+
+        Args:
+            text (str): A date format text in Japanese style
+
+        """
+        self.extend([text])
+
+    def extend(self, texts: Iterable[str]) -> None:
+        """Insert texts without rebuilding the index
+
+        * New positions continue from the current size.
+        * If the texts are not older than the latest timestamp, they are appended in O(k) for k texts.
+
+        Args:
+            texts (Iterable[str]): Date format texts in Japanese style
+
+        Raises:
+            ValueError: If aware texts are given to a non-empty naive index
+
+        """
+        column = self._parse_all(texts)
+        if len(column) == 0:
+            return
+        if self._codec.tzinfo is None and column.tzinfo is not None:
+            if len(self) > 0:
+                raise ValueError("Cannot append aware datetimes to a naive TimeIndex")
+            self._codec = DatetimeColumn(tzinfo=column.tzinfo)
+
+        if column.tzinfo is None and self._codec.tzinfo is not None:
+            # Read naive texts as local time in the index zone, as queries do
+            values: Iterable[int] = [self._codec.encode(dt) for dt in column]
+        else:
+            values = column.epoch_microseconds
+
+        keys = self._keys
+        positions = self._positions
+        position = len(keys)
+        for value in values:
+            if not keys or keys[-1] <= value:
+                keys.append(value)
+                positions.append(position)
+            else:
+                i = bisect_right(keys, value)
+                keys.insert(i, value)
+                positions.insert(i, position)
+            position += 1
+
+    # ********************
+    # queries
+    # ********************
+    def between(self, start: str | datetime, end: str | datetime, inclusive: bool = True) -> list[int]:
+        """Return original positions of texts between `start` and `end` in time order
+
+        Args:
+            start (str or datetime.datetime): A date format text in Japanese style
+            end (str or datetime.datetime): Same as above
+            inclusive (bool): Whether or not include texts equal to `end`
+
+        Returns:
+            list[int]: Original positions
+
+        """
+        lo = bisect_left(self._keys, self._to_key(start))
+        end_key = self._to_key(end)
+        hi = bisect_right(self._keys, end_key) if inclusive else bisect_left(self._keys, end_key)
+
+        return self._positions[lo:hi].tolist()
+
+    def nearest(self, date: str | datetime) -> int:
+        """Return the original position of the text nearest to `date`
+
+        * If two texts are equally near, the earlier one is returned.
+
+        Args:
+            date (str or datetime.datetime): A date format text in Japanese style
+
+        Returns:
+            int: An original position
+
+        Raises:
+            ValueError: If the index is empty
+
+        """
+        if not self._keys:
+            raise ValueError("Cannot query an empty TimeIndex")
+
+        keys = self._keys
+        key = self._to_key(date)
+        i = bisect_left(keys, key)
+        if i == len(keys) or (i > 0 and key - keys[i - 1] <= keys[i] - key):
+            i = bisect_left(keys, keys[i - 1])  # the first of equal timestamps
+
+        return self._positions[i]
+
+    def resample(self, unit: str = "hour") -> dict[datetime, int]:
+        """Count texts in each period
+
+        Args:
+            unit ("second" or "minute" or "hour" or "day" or "month" or "year"): A period
+
+        Returns:
+            dict[datetime.datetime, int]: Counts of non-empty periods in time order
+
+        Raises:
+            ValueError: If an invalid unit is given
+
+        """
+        if unit not in _FIXED_UNIT_MICROSECONDS and unit not in _CALENDAR_UNITS:
+            raise ValueError(f"An invalid unit: {unit}")
+
+        counts: dict[datetime, int] = dict()
+        if self._codec.tzinfo is None and unit in _FIXED_UNIT_MICROSECONDS:
+            # Naive keys are wall-clock microseconds, so periods are found by integer arithmetic
+            width = _FIXED_UNIT_MICROSECONDS[unit]
+            bucket = None
+            count = 0
+            for value in self._keys:
+                value_bucket = value - value % width
+                if value_bucket != bucket:
+                    if bucket is not None:
+                        counts[self._codec.decode(bucket)] = count
+                    bucket = value_bucket
+                    count = 0
+                count += 1
+            if bucket is not None:
+                counts[self._codec.decode(bucket)] = count
+        else:
+            for value in self._keys:
+                period = _truncate(self._codec.decode(value), unit)
+                counts[period] = counts.get(period, 0) + 1
+
+        return counts
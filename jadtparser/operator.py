@@ -2,12 +2,79 @@
 
 """
 
+from collections.abc import Callable, Iterator
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
+import re
 
-from .parser import infer_dateformat_ja
+from .cache import ParseCache
+from .parser import compile_dateformat, infer_dateformat_ja
 from .type_converter import to_datetime
 
+# ********************
+# constants
+# ********************
+_FIXED_UNITS = {
+    "week": timedelta(weeks=1),
+    "day": timedelta(days=1),
+    "hour": timedelta(hours=1),
+    "minute": timedelta(minutes=1),
+    "second": timedelta(seconds=1),
+}
+_DIRECTIVE_SPLIT_PATTERN = re.compile(r"(%[YmdHMSf%])")
+_UNIT_DIRECTIVES = {
+    "year": "%Y",
+    "month": "%m",
+    "week": "%d",
+    "day": "%d",
+    "hour": "%H",
+    "minute": "%M",
+    "second": "%S",
+}
+_DIRECTIVE_FIELDS = {"Y": 0, "m": 1, "d": 2, "H": 3, "M": 4, "S": 5, "f": 6}
+_DIRECTIVE_RENDERERS: dict[str, Callable[[int], str]] = {
+    "Y": "{:04d}".format,
+    "m": "{:02d}".format,
+    "d": "{:02d}".format,
+    "H": "{:02d}".format,
+    "M": "{:02d}".format,
+    "S": "{:02d}".format,
+    "f": "{:06d}".format,
+}
+
+
+# ********************
+# private classes
+# ********************
+class _IncrementalFormatter:
+    """A formatter which re-renders only fields changed from the previous datetime"""
+
+    def __init__(self, fmt: str):
+        self._parts = list()
+        self._fields = list()
+        for part in _DIRECTIVE_SPLIT_PATTERN.split(fmt):
+            if part == "%%":
+                self._parts.append("%")
+            elif part.startswith("%") and part[1:] in _DIRECTIVE_FIELDS:
+                self._fields.append((len(self._parts), part[1:]))
+                self._parts.append("")
+            elif part:
+                self._parts.append(part)
+
+        self._previous: tuple[int, ...] | None = None
+
+    def format(self, dt: datetime) -> str:
+        values = (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond)
+        previous = self._previous
+        for i, directive in self._fields:
+            field = _DIRECTIVE_FIELDS[directive]
+            if previous is None or previous[field] != values[field]:
+                self._parts[i] = _DIRECTIVE_RENDERERS[directive](values[field])
+        self._previous = values
+
+        return "".join(self._parts)
+
+
 # ********************
 # private functions
 # ********************
@@ -28,12 +95,35 @@ def _make_tdelta(interval: int, unit: str) -> relativedelta:
     return tdelta
 
 
+def _generate_range(
+    start: datetime, end: datetime, step: int, unit: str, formatter: _IncrementalFormatter | None
+) -> Iterator[str | datetime]:
+    def in_range(dt: datetime) -> bool:
+        return dt <= end if step > 0 else dt >= end
+
+    if unit in _FIXED_UNITS:
+        tdelta = _FIXED_UNITS[unit] * step
+        dt = start
+        while in_range(dt):
+            yield dt if formatter is None else formatter.format(dt)
+            dt += tdelta
+    else:
+        k = 0
+        dt = start
+        while in_range(dt):
+            yield dt if formatter is None else formatter.format(dt)
+            k += 1
+            dt = start + _make_tdelta(step * k, unit)
+
+
 # ********************
 # public functions
 # ********************
 
 
-def date_add(date: str, interval: int, unit: str = "day", convert_dt: bool = False) -> str | datetime:
+def date_add(
+    date: str, interval: int, unit: str = "day", convert_dt: bool = False, cache: ParseCache | None = None
+) -> str | datetime:
     """Parse a text and add a timedelta
 
     * Return the result with preserving the given date-format if `convert_dt` is set to False.
@@ -43,6 +133,7 @@ def date_add(date: str, interval: int, unit: str = "day", convert_dt: bool = Fal
         interval (int): A additional interval
         unit ("day" or "week" or "month" or "year"): A additional unit
         convert_dt (bool): Whether or not convert the datetime object
+        cache (ParseCache or None): A cache of operation results
 
     Returns:
         str or datetime.datetime: The operation result
@@ -52,12 +143,18 @@ def date_add(date: str, interval: int, unit: str = "day", convert_dt: bool = Fal
 
     """
 
+    if cache is not None:
+        key = ("date_add", date, interval, unit, convert_dt)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
     try:
         inferred_format = infer_dateformat_ja(date)
     except ValueError:
         raise ValueError(f"Cannot parse the given text: {date} as Japanese date-format.")
 
-    dt = datetime.strptime(date, inferred_format)
+    dt = compile_dateformat(inferred_format).parse(date)
     tdelta = _make_tdelta(interval, unit)
     result = dt + tdelta
 
@@ -67,10 +164,15 @@ def date_add(date: str, interval: int, unit: str = "day", convert_dt: bool = Fal
     else:
         output = result.strftime(inferred_format)
 
+    if cache is not None:
+        cache.put(key, output)
+
     return output
 
 
-def date_sub(date: str, interval: int, unit: str = "day", convert_dt: bool = False) -> str | datetime:
+def date_sub(
+    date: str, interval: int, unit: str = "day", convert_dt: bool = False, cache: ParseCache | None = None
+) -> str | datetime:
     """Parse a text and subtract a timedelta
 
     * Return the result with preserving the given date-format if `convert_dt` is set to False.
@@ -80,6 +182,7 @@ def date_sub(date: str, interval: int, unit: str = "day", convert_dt: bool = Fal
         interval (int): A subtraction interval
         unit ("day" or "week" or "month" or "year"): A subtraction unit
         convert_dt (bool): Whether or not convert the datetime object
+        cache (ParseCache or None): A cache of operation results
 
     Returns:
         str or datetime.datetime: The operation result
@@ -89,12 +192,18 @@ def date_sub(date: str, interval: int, unit: str = "day", convert_dt: bool = Fal
 
     """
 
+    if cache is not None:
+        key = ("date_sub", date, interval, unit, convert_dt)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
     try:
         inferred_format = infer_dateformat_ja(date)
     except ValueError:
         raise ValueError(f"Cannot parse the given text: {date} as Japanese date-format.")
 
-    dt = datetime.strptime(date, inferred_format)
+    dt = compile_dateformat(inferred_format).parse(date)
     tdelta = _make_tdelta(interval, unit)
     result = dt - tdelta
 
@@ -104,6 +213,9 @@ def date_sub(date: str, interval: int, unit: str = "day", convert_dt: bool = Fal
     else:
         output = result.strftime(inferred_format)
 
+    if cache is not None:
+        cache.put(key, output)
+
     return output
 
 
@@ -130,3 +242,51 @@ def date_diff(date1: str, date2: str, relative: bool = False) -> timedelta | rel
         tdelta = parsed_date1 - parsed_date2
 
     return tdelta
+
+
+def date_range(
+    start: str, end: str, step: int = 1, unit: str = "day", convert_dt: bool = False
+) -> Iterator[str | datetime]:
+    """Lazily generate dates from `start` to `end` (inclusive) with preserving the date-format of `start`
+
+    * Both endpoints are parsed by `to_datetime` separately, so `end` may have another format than `start`.
+    * With `convert_dt` = False, the date-format of `start` must have a field for `unit` (e.g. 時 for "hour"),
+      otherwise items would collapse into duplicates. Use `convert_dt` = True for finer units.
+    * Month and year steps are counted from `start`, so a month-end does not drift (e.g. 1/31, 2/28, 3/31).
+    * Only fields changed from the previous item are re-rendered.
+
+    Args:
+        start (str): A date-format text in Japanese style
+        end (str): A date-format text
+        step (int): An interval between items. If negative, then dates are generated backward.
+        unit ("second" or "minute" or "hour" or "day" or "week" or "month" or "year"): A unit of `step`
+        convert_dt (bool): Whether or not yield datetime objects
+
+    Yields:
+        str or datetime.datetime: A date
+
+    Raises:
+        ValueError: If given an non-Japanese date-format `start` or `start` without a field for `unit`
+                    with `convert_dt` = False, zero step, or invalid unit
+
+    """
+
+    if step == 0:
+        raise ValueError("step must not be zero")
+    if unit not in _FIXED_UNITS:
+        _make_tdelta(step, unit)  # validate unit
+
+    formatter = None
+    if not convert_dt:
+        try:
+            fmt = infer_dateformat_ja(start)
+        except ValueError:
+            raise ValueError(f"Cannot parse the given text: {start} as Japanese date-format.")
+        if _UNIT_DIRECTIVES[unit] not in _DIRECTIVE_SPLIT_PATTERN.split(fmt):
+            raise ValueError(f"The date-format of {start} has no field for unit: {unit}. Use convert_dt = True.")
+        formatter = _IncrementalFormatter(fmt)
+
+    start_dt = to_datetime(start)
+    end_dt = to_datetime(end)
+    return _generate_range(start_dt, end_dt, step, unit, formatter)
+
@@ -5,6 +5,9 @@
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import NamedTuple
+import random
 import re
 
 # ********************
@@ -17,6 +20,52 @@ _HOUR_PARTITIONS = ["時", ":", "："]
 _MINUTE_PARTITIONS = ["分", ":", "："]
 _SECOND_PARTITIONS = ["秒", ":", "：", "."]
 _MICROSECOND_PARTITIONS = ["秒", "マイクロ秒", ""]
+_FIELD_KEYS = ["year", "month", "day", "hour", "minute", "second", "microsecond"]
+_FIELD_PARTITIONS = [
+    _YEAR_PARTITIONS, _MONTH_PARTITIONS, _DAY_PARTITIONS + ["T"],
+    _HOUR_PARTITIONS, _MINUTE_PARTITIONS, _SECOND_PARTITIONS, _MICROSECOND_PARTITIONS
+]
+_WEEKDAY_TABLE = {"月": 0, "火": 1, "水": 2, "木": 3, "金": 4, "土": 5, "日": 6}
+_MERIDIEM_TABLE = {"午前": 0, "午後": 12}
+_TOKEN_PATTERN = re.compile(
+    r"(?P<digit>[0-9]+)"
+    r"|(?P<weekday>[(（][月火水木金土日](?:曜日?)?[)）]|[月火水木金土日]曜日?)"
+    r"|(?P<meridiem>午前|午後)"
+    r"|(?P<noon>正午)"
+    r"|(?P<qualifier>頃|ごろ)"
+    r"|(?P<space>\s+)"
+    r"|(?P<sep>.)"
+)
+_JST = timezone(timedelta(hours=9), "JST")
+_ZONE_TABLE: dict[str, tzinfo] = {
+    "Z": timezone.utc,
+    "UTC": timezone.utc,
+    "GMT": timezone.utc,
+    "協定世界時": timezone.utc,
+    "JST": _JST,
+    "日本時間": _JST,
+    "日本標準時": _JST,
+}
+_ZONE_PATTERN = re.compile(
+    r"\s*(?:[(（]?(?P<name>" + "|".join(sorted(_ZONE_TABLE, key=len, reverse=True)) + r")[)）]?"
+    r"|(?P<offset>[+-][0-9]{2}(?::?[0-9]{2})?))\s*$"
+)
+_OFFSET_ZONES: dict[str, tzinfo] = dict()  # read without locks, filled idempotently
+_DIRECTIVE_PATTERNS = {
+    "Y": r"([0-9]{4})",
+    "m": r"([0-9]{1,2})",
+    "d": r"([0-9]{1,2})",
+    "H": r"([0-9]{1,2})",
+    "M": r"([0-9]{1,2})",
+    "S": r"([0-9]{1,2})",
+    "f": r"([0-9]{1,6})",
+}
+_DIRECTIVE_ORDER = "YmdHMSf"
+_DIRECTIVE_DEFAULTS = [1, 1, 1, 0, 0, 0, 0]
+_DEFAULT_SAMPLE_SIZE = 1000
+_DIGIT_PATTERN = re.compile(r"[0-9]+")
+_NONDIGIT_PATTERN = re.compile(r"[^0-9]+")
+_COMPILED_FORMATS: dict[str, "CompiledFormat"] = dict()  # read without locks, filled idempotently
 
 # ********************
 # private classes
@@ -30,8 +79,8 @@ class _PatterntailSplitter(metaclass=ABCMeta):
         raise NotImplementedError
 
     @classmethod
-    def _split_pattern_and_tail(cls, text: str, pattern: str) -> tuple[str, str]:
-        m = re.search(pattern, text)
+    def _split_pattern_and_tail(cls, text: str, pattern: re.Pattern) -> tuple[str, str]:
+        m = pattern.search(text)
 
         if m is None:
             raise ValueError(cls._PARSE_ERROR_MESSAGE.format(text=text))
@@ -46,8 +95,7 @@ class _DigittailSplitter(_PatterntailSplitter):
 
     @classmethod
     def split(cls, text: str) -> tuple[str, str]:
-        pattern = r"[0-9]+"
-        return cls._split_pattern_and_tail(text, pattern)
+        return cls._split_pattern_and_tail(text, _DIGIT_PATTERN)
 
 
 class _NondigittailSplitter(_PatterntailSplitter):
@@ -55,8 +103,115 @@ class _NondigittailSplitter(_PatterntailSplitter):
 
     @classmethod
     def split(cls, text: str) -> tuple[str, str]:
-        pattern = r"[^0-9]+"
-        return cls._split_pattern_and_tail(text, pattern)
+        return cls._split_pattern_and_tail(text, _NONDIGIT_PATTERN)
+
+
+# ********************
+# public classes
+# ********************
+class ParsedDatetime(NamedTuple):
+    """A result of parse_datetime_ja
+
+    Attributes:
+        value (datetime.datetime): A parsed datetime object, which is aware if the text has a zone designator
+        approximate (bool): Whether or not the text has a qualifier such as 頃
+
+    """
+
+    value: datetime
+    approximate: bool
+
+
+class CompiledFormat:
+    """A precompiled date-format which parses texts without datetime.strptime
+
+    * Only the directives produced by `infer_dateformat_ja` (%Y, %m, %d, %H, %M, %S and %f) are supported.
+    * Instances are immutable and safe to share between threads.
+
+    Args:
+        fmt (str): A Python date format
+
+    Raises:
+        ValueError: If an unsupported directive is given
+
+    """
+
+    def __init__(self, fmt: str):
+        pattern = ""
+        directives = list()
+        i = 0
+        while i < len(fmt):
+            c = fmt[i]
+            if c == "%" and i + 1 < len(fmt):
+                directive = fmt[i + 1]
+                if directive == "%":
+                    pattern += "%"
+                elif directive in _DIRECTIVE_PATTERNS:
+                    pattern += _DIRECTIVE_PATTERNS[directive]
+                    directives.append(directive)
+                else:
+                    raise ValueError(f"Unsupported directive: %{directive}")
+                i += 2
+            else:
+                pattern += r"\s+" if c.isspace() else re.escape(c)
+                i += 1
+
+        self._format = fmt
+        self._pattern = re.compile(pattern)
+        self._positions = tuple(directives.index(d) if d in directives else None for d in _DIRECTIVE_ORDER)
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._format!r})"
+
+    def parse(self, text: str) -> datetime:
+        """Parse a text in the compiled format
+
+        Args:
+            text (str): A date format text
+
+        Returns:
+            datetime.datetime: A parsed datetime object
+
+        Raises:
+            ValueError: If the text does not match the format
+
+        """
+
+        m = self._pattern.fullmatch(text)
+        if m is None:
+            raise ValueError(f"time data {text!r} does not match format {self._format!r}")
+
+        groups = m.groups()
+        values = list()
+        for position, default in zip(self._positions, _DIRECTIVE_DEFAULTS):
+            values.append(default if position is None else groups[position])
+        if self._positions[6] is not None:
+            values[6] = groups[self._positions[6]].ljust(6, "0")
+
+        return datetime(*map(int, values))  # type: ignore
+
+
+class FormatDetection(NamedTuple):
+    """A result of detect_format
+
+    Attributes:
+        format (str or None): The most frequent date-format in the sample
+        compiled (CompiledFormat or None): The compiled winning date-format
+        confidence (float): The ratio of sampled texts in the winning date-format
+        frequencies (dict[str, int]): Counts of each date-format in the sample, in descending order
+        sample_size (int): The number of sampled texts
+
+    """
+
+    format: str | None
+    compiled: CompiledFormat | None
+    confidence: float
+    frequencies: dict[str, int]
+    sample_size: int
 
 
 # ********************
@@ -78,6 +233,8 @@ def _parse(text: str) -> tuple[dict[str, str], dict[str, str]]:
         digit, tail = _DigittailSplitter.split(tail)
         pt, tail = _NondigittailSplitter.split(tail)
 
+        if i >= len(keys):
+            raise ValueError(f"Cannot split text: {text} into at most {len(keys)} fields.")
         k = keys[i]
         if k not in parsed_result:
             parsed_result[k] = digit
@@ -94,6 +251,142 @@ def _parse(text: str) -> tuple[dict[str, str], dict[str, str]]:
     return parsed_result, partitions
 
 
+def _normalize_partition(pt: str) -> str:
+    stripped = pt.strip()
+    if stripped:
+        return stripped
+    return " " if pt else ""
+
+
+def _tokenize_ja(text: str) -> tuple[list[str], list[str], dict]:
+    digits: list[str] = list()
+    partitions: list[str] = list()
+    annotations: dict = {"weekday": None, "meridiem": None, "meridiem_at": None, "noon": False, "approximate": False}
+
+    for m in _TOKEN_PATTERN.finditer(text):
+        kind = m.lastgroup
+        token = m.group()
+        if annotations["approximate"] and kind != "space":
+            raise ValueError(f"A qualifier must be at the end of the text: {text}")
+
+        if kind == "digit":
+            digits.append(token)
+            partitions.append("")
+        elif not digits:
+            raise ValueError(f"The text must start with digits: {text}")
+        elif kind == "sep":
+            partitions[-1] += token
+        elif kind == "space":
+            partitions[-1] += " "
+        elif kind == "qualifier":
+            annotations["approximate"] = True
+        else:
+            partitions[-1] += " "  # an annotation separates fields like a space
+
+        if kind == "weekday":
+            annotations["weekday"] = _WEEKDAY_TABLE[token.lstrip("(（")[0]]
+        elif kind == "meridiem":
+            annotations["meridiem"] = _MERIDIEM_TABLE[token]
+            annotations["meridiem_at"] = len(digits)
+        elif kind == "noon":
+            annotations["noon"] = True
+
+    return digits, [_normalize_partition(pt) for pt in partitions], annotations
+
+
+def _get_offset_zone(offset: str) -> tzinfo:
+    zone = _OFFSET_ZONES.get(offset)
+    if zone is None:
+        digits = offset[1:].replace(":", "")
+        minutes = int(digits[:2]) * 60 + int(digits[2:] or "0")
+        if minutes >= 24 * 60:
+            raise ValueError(f"An invalid UTC offset: {offset}")
+        delta = timedelta(minutes=minutes if offset[0] == "+" else -minutes)
+        zone = _OFFSET_ZONES.setdefault(offset, timezone(delta))
+
+    return zone
+
+
+def _split_zone(text: str) -> tuple[str, tzinfo | None]:
+    # Split a trailing zone designator. A numeric offset follows a time, not a day like 2022-11-01.
+    m = _ZONE_PATTERN.search(text)
+    if m is None:
+        return text, None
+
+    body = text[:m.start()]
+    if m.group("name") is not None:
+        return body, _ZONE_TABLE[m.group("name")]
+    if len(_DIGIT_PATTERN.findall(body)) < 4:
+        return text, None
+
+    return body, _get_offset_zone(m.group("offset"))
+
+
+def _parse_datetime_ja(text: str) -> tuple[ParsedDatetime, tuple[str, ...]]:
+    body, zone = _split_zone(text)
+    digits, partitions, annotations = _tokenize_ja(body)
+    error_message = f"Cannot parse the given text: {text}"
+
+    # validate digits and partitions
+    num_fields = len(digits)
+    if num_fields == 0 or num_fields > len(_FIELD_KEYS):
+        raise ValueError(error_message)
+    if len(digits[0]) != 4:
+        raise ValueError(error_message)
+    for i in range(num_fields):
+        pt = partitions[i]
+        if not pt:
+            if i == 0 or i != num_fields - 1:
+                raise ValueError(error_message)
+        elif pt not in _FIELD_PARTITIONS[i]:
+            raise ValueError(error_message)
+        if 0 < i < 6 and len(digits[i]) > 2:
+            raise ValueError(error_message)
+    if num_fields == 7 and len(digits[6]) > 6:
+        raise ValueError(error_message)
+
+    values = [int(d) for d in digits[:6]]
+    values += [1, 1, 1, 0, 0, 0][num_fields:]
+    microsecond = int(digits[6].ljust(6, "0")) if num_fields == 7 else 0
+
+    # apply annotations
+    if annotations["noon"]:
+        if num_fields != 3 or annotations["meridiem"] is not None:
+            raise ValueError(error_message)
+        values[3] = 12
+    if annotations["meridiem"] is not None:
+        if annotations["meridiem_at"] != 3 or num_fields < 4 or values[3] > 12:
+            raise ValueError(error_message)
+        values[3] = values[3] % 12 + annotations["meridiem"]
+
+    dt = datetime(*values, microsecond, tzinfo=zone)  # type: ignore
+
+    if annotations["weekday"] is not None:
+        if num_fields < 3 or dt.weekday() != annotations["weekday"]:
+            raise ValueError(f"The weekday annotation does not match the date: {text}")
+
+    layout = tuple(partitions) + (zone is not None,)
+    return ParsedDatetime(dt, annotations["approximate"]), layout
+
+
+def _sample_texts(texts: Iterable[str], sample: int, seed: int | None) -> list[str]:
+    # Keep the head of texts and fill the remainder by reservoir sampling
+    head = sample // 2
+    reservoir_size = sample - head
+    rng = random.Random(seed)
+
+    sampled: list[str] = list()
+    for i, t in enumerate(texts):
+        if i < sample:
+            sampled.append(t)
+            continue
+        j = rng.randrange(i - head + 1)
+        if j < reservoir_size:
+            sampled[head + j] = t
+
+    return sampled
+
+
 # ********************
 # public functions
 # ********************
@@ -177,10 +470,132 @@ def infer_dateformat_ja_all(texts: Iterable[str]) -> list[str]:
 
     """
 
-    inferred_formats = list()
+    inferred_formats = dict()
     for t in texts:
         fmt = infer_dateformat_ja(t)
         if fmt not in inferred_formats:
-            inferred_formats.append(fmt)
+            inferred_formats[fmt] = None
+
+    return list(inferred_formats)
+
+
+def compile_dateformat(fmt: str) -> CompiledFormat:
+    """Compile a date-format inferred by `infer_dateformat_ja`
+
+    * Compiled formats are memoized in a module-level dict, which is looked up without locks.
+
+    Args:
+        fmt (str): A Python date format
+
+    Returns:
+        CompiledFormat: A compiled date-format
+
+    Raises:
+        ValueError: If an unsupported directive is given
+
+    """
+
+    compiled = _COMPILED_FORMATS.get(fmt)
+    if compiled is None:
+        compiled = _COMPILED_FORMATS.setdefault(fmt, CompiledFormat(fmt))
+
+    return compiled
+
 
-    return inferred_formats
+def detect_format(texts: Iterable[str], sample: int = _DEFAULT_SAMPLE_SIZE, seed: int | None = None) -> FormatDetection:
+    """Detect the date-format of list-like object of texts in Japanese style from a sample
+
+    * The sample consists of the head of texts and a random reservoir over the remainder.
+    * Texts which cannot be inferred are counted in the sample size but not in `frequencies`.
+
+    Args:
+        texts (Iterable[str]): Date format texts in Japanese style
+        sample (int): The maximum number of sampled texts
+        seed (int or None): A random seed for the reservoir
+
+    Returns:
+        FormatDetection: The detected date-formats and the confidence
+
+    Raises:
+        ValueError: If `sample` is not positive
+
+    """
+
+    if sample <= 0:
+        raise ValueError(f"An invalid sample size: {sample}")
+
+    sampled = _sample_texts(texts, sample, seed)
+
+    counts: dict[str, int] = dict()
+    for t in sampled:
+        try:
+            fmt = infer_dateformat_ja(t)
+        except ValueError:
+            continue
+        counts[fmt] = counts.get(fmt, 0) + 1
+
+    frequencies = dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+    if not frequencies:
+        return FormatDetection(None, None, 0.0, frequencies, len(sampled))
+
+    winner = next(iter(frequencies))
+    confidence = frequencies[winner] / len(sampled)
+
+    return FormatDetection(winner, compile_dateformat(winner), confidence, frequencies, len(sampled))
+
+
+
+def parse_datetime_ja(text: str) -> ParsedDatetime:
+    """Parse a date-format text in Japanese style with extended annotations in a single pass
+
+    This method parse texts which start year, and also accepts the following tokens.
+
+    * 午前/午後 before hour digits: converted from 12-hour to 24-hour clock
+    * 正午 after a date: 12:00
+    * A weekday annotation such as (火), （火曜）or 火曜日: validated against the parsed date
+    * A qualifier 頃 or ごろ at the end of the text: reported as `approximate`
+    * T between a date and a time
+    * A trailing zone designator such as JST, 日本時間, Z, UTC or +09:00: set as tzinfo of the result
+
+    Args:
+        text (str): A date format text in Japanese style
+
+    Returns:
+        ParsedDatetime: A parsed datetime object and its qualifier flag
+
+    Raises:
+        ValueError: If invalid any date separators or annotations are given
+
+    """
+
+    parsed, _ = _parse_datetime_ja(text)
+    return parsed
+
+
+def parse_datetime_ja_all(texts: Iterable[str]) -> list[ParsedDatetime]:
+    """Parse list-like object of date-format texts in Japanese style with extended annotations
+
+    See `parse_datetime_ja` for the accepted tokens.
+
+    Args:
+        texts (Iterable[str]): A date format text in Japanese style
+
+    Returns:
+        list[ParsedDatetime]: Parsed datetime objects and thier qualifier flags
+
+    Raises:
+        ValueError: If failed to parse any texts, or the texts have multiple layouts of separators
+
+    """
+
+    parsed_list = list()
+    layout = None
+    for t in texts:
+        parsed, parsed_layout = _parse_datetime_ja(t)
+        if layout is None:
+            layout = parsed_layout
+        elif parsed_layout != layout:
+            raise ValueError(f"Cannot parse the given texts in ONE layout: {t}")
+        parsed_list.append(parsed)
+
+    return parsed_list
@@ -2,13 +2,217 @@
 
 """
 
-from datetime import datetime
+from datetime import datetime, tzinfo
 import dateutil.parser
 import dateutil.tz
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 
 from .alias import StrOrIterable, DatetimeOrList, DateOrList, TimeOrList
-from .parser import infer_dateformat_ja, infer_dateformat_ja_all
+from .cache import ParseCache
+from .column import DatetimeColumn
+from .parser import (
+    compile_dateformat, detect_format, infer_dateformat_ja, infer_dateformat_ja_all,
+    parse_datetime_ja, parse_datetime_ja_all
+)
+
+
+# ********************
+# private functions
+# ********************
+
+
+def _parse_extended(text: str) -> datetime:
+    # Try the extended Japanese grammar before falling back to dateutil
+    try:
+        return parse_datetime_ja(text).value
+    except ValueError:
+        return dateutil.parser.parse(text)
+
+
+def _attach_tz(dt_obj: datetime, tz_obj: tzinfo | None) -> datetime:
+    # Append a timezone to a naive datetime, or normalize an aware one into the timezone
+    if dt_obj.tzinfo is None:
+        return dt_obj.replace(tzinfo=tz_obj)
+    return dt_obj.astimezone(tz_obj)
+
+
+def _make_column(dt_objs: Iterable[datetime], tz_obj: tzinfo | None) -> DatetimeColumn:
+    # Without a given timezone, take the tzinfo of the first value so that aware values can be stored.
+    # Then naive values are rejected, as a naive column rejects aware values, so results do not depend on the order.
+    dt_iter = iter(dt_objs)
+    first = next(dt_iter, None)
+    if first is None or tz_obj is not None or first.tzinfo is None:
+        return DatetimeColumn(chain(() if first is None else (first,), dt_iter), tzinfo=tz_obj)
+
+    column = DatetimeColumn([first], tzinfo=first.tzinfo)
+    for dt_obj in dt_iter:
+        if dt_obj.tzinfo is None:
+            raise ValueError("Cannot store a naive datetime in a DatetimeColumn of aware datetimes")
+        column.append(dt_obj)
+    return column
+
+
+def _infer_one(text: str) -> str | None:
+    try:
+        return infer_dateformat_ja(text)
+    except ValueError:
+        return None  # Imply not Japanese or invalid format
+
+
+def _parse_one(text: str) -> datetime:
+    inferred_format = _infer_one(text)
+    if inferred_format is not None:
+        return compile_dateformat(inferred_format).parse(text)
+    else:
+        return _parse_extended(text)
+
+
+def _make_sampled_parse(texts: Iterable[str], sample: int) -> Callable[[str], datetime]:
+    # Parse texts by the detected format and re-infer only texts which fail it
+    compiled = detect_format(texts, sample=sample).compiled
+
+    def parse(text: str) -> datetime:
+        if compiled is not None:
+            try:
+                return compiled.parse(text)
+            except ValueError:
+                pass
+        return _parse_one(text)
+
+    return parse
+
+
+def _map_chunks(func: Callable[[Sequence[str]], list], texts: Sequence[str], threads: int) -> list[list]:
+    # Split texts into contiguous chunks so that results are returned in order
+    chunk_size = -(-len(texts) // threads)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(func, chunks))
+
+
+def _is_threaded(texts: Sequence[str], threads: int | None) -> bool:
+    return threads is not None and threads > 1 and len(texts) > 1
+
+
+def _map_parse(parse: Callable[[str], datetime], texts: Sequence[str], threads: int | None) -> Iterable[datetime]:
+    if not _is_threaded(texts, threads):
+        return map(parse, texts)
+
+    def parse_chunk(chunk: Sequence[str]) -> list[datetime]:
+        return [parse(text) for text in chunk]
+
+    return list(chain.from_iterable(_map_chunks(parse_chunk, texts, threads)))  # type: ignore
+
+
+def _infer_formats(texts: Sequence[str], threads: int | None) -> list[str]:
+    if not _is_threaded(texts, threads):
+        return infer_dateformat_ja_all(texts)
+
+    inferred_formats = _map_chunks(infer_dateformat_ja_all, texts, threads)  # type: ignore
+    return list(dict.fromkeys(chain.from_iterable(inferred_formats)))
+
+
+def _parse_extended_all(texts: Sequence[str], threads: int | None) -> list[datetime]:
+    if not _is_threaded(texts, threads):
+        return [parsed.value for parsed in parse_datetime_ja_all(texts)]
+
+    def parse_chunk(chunk: Sequence[str]) -> tuple[str, list]:
+        return chunk[0], parse_datetime_ja_all(chunk)
+
+    results = _map_chunks(parse_chunk, texts, threads)  # type: ignore
+    # Each chunk is parsed in one layout, so the first texts of chunks must be in one layout too
+    parse_datetime_ja_all([head for head, _ in results])
+    return [parsed.value for _, chunk in results for parsed in chunk]
+
+
+def _parse_batch(texts: Sequence[str], inferred_formats: list[str], threads: int | None) -> Iterable[datetime]:
+    # `inferred_formats` is empty if some texts are not in plain Japanese formats
+    if len(inferred_formats) == 1:
+        compiled = compile_dateformat(inferred_formats[0])
+        return _map_parse(compiled.parse, texts, threads)
+    elif len(inferred_formats) == 0:
+        try:
+            return _parse_extended_all(texts, threads)
+        except ValueError:
+            pass  # Imply not Japanese or invalid format
+
+    return _map_parse(dateutil.parser.parse, texts, threads)
+
+
+def _to_datetime_cached(
+    date: StrOrIterable,
+    with_tz: bool,
+    tz_name: str,
+    as_column: bool,
+    sample: int | None,
+    threads: int | None,
+    cache: ParseCache,
+) -> DatetimeOrList:
+    # Look up each distinct text once and parse only missing texts in one batch.
+    # Each result is stored with its inferred format (None if not a plain Japanese format),
+    # so that the format rule of a batch is checked over all distinct texts as without cache.
+    # Results of a batch are stored only if it is in one plain format, where they equal results of single texts.
+    tz_key = tz_name if with_tz else None
+    tz_obj = dateutil.tz.gettz(tz_name)
+
+    if isinstance(date, str):
+        key = ("to_datetime", date, tz_key, None)
+        entry = cache.get(key)
+        if entry is None:
+            entry = (_infer_one(date), to_datetime(date, with_tz=with_tz, tz_name=tz_name))
+            cache.put(key, entry)
+        return entry[1]
+
+    elif isinstance(date, Iterable):
+        if not isinstance(date, Sequence):
+            date = list(date)
+
+        distinct = list(dict.fromkeys(date))
+        entries = dict()
+        missing = list()
+        for dtstr in distinct:
+            entry = cache.get(("to_datetime", dtstr, tz_key, sample))
+            if entry is None:
+                missing.append(dtstr)
+            else:
+                entries[dtstr] = entry
+
+        parsed: dict[str, datetime]
+        if sample is not None:
+            # Multi formats are allowed in sampling mode, so each result does not depend on other texts
+            parsed_list = to_datetime(missing, with_tz=with_tz, tz_name=tz_name, sample=sample, threads=threads)
+            for dtstr, dt_obj in zip(missing, parsed_list):  # type: ignore
+                cache.put(("to_datetime", dtstr, tz_key, sample), (None, dt_obj))
+            parsed = {dtstr: entry[1] for dtstr, entry in entries.items()}
+            parsed.update(zip(missing, parsed_list))  # type: ignore
+        else:
+            missing_formats = [_infer_one(dtstr) for dtstr in missing]
+            formats = list(dict.fromkeys(chain((entry[0] for entry in entries.values()), missing_formats)))
+            if len(formats) == 1 and formats[0] is not None:
+                compiled = compile_dateformat(formats[0])
+                parsed_iter = _map_parse(compiled.parse, missing, threads)
+                if with_tz:
+                    parsed_iter = (_attach_tz(dt_obj, tz_obj) for dt_obj in parsed_iter)
+                parsed = {dtstr: entry[1] for dtstr, entry in entries.items()}
+                for dtstr, dt_obj in zip(missing, parsed_iter):
+                    cache.put(("to_datetime", dtstr, tz_key, None), (formats[0], dt_obj))
+                    parsed[dtstr] = dt_obj
+            else:
+                # Results of a batch not in one plain format depend on all texts, so parse them as a whole
+                parsed_iter = _parse_batch(distinct, [] if None in formats else formats, threads)  # type: ignore
+                if with_tz:
+                    parsed_iter = (_attach_tz(dt_obj, tz_obj) for dt_obj in parsed_iter)
+                parsed = dict(zip(distinct, parsed_iter))
+
+        dt_objs = (parsed[dtstr] for dtstr in date)
+        if as_column:
+            return _make_column(dt_objs, tz_obj if with_tz else None)
+        return list(dt_objs)
+
+    else:
+        raise TypeError("Invalid type")
 
 
 # ********************
@@ -16,19 +220,48 @@ from .parser import infer_dateformat_ja, infer_dateformat_ja_all
 # ********************
 
 
-def to_datetime(date: StrOrIterable, with_tz: bool = False, tz_name: str = "Asia/Tokyo") -> DatetimeOrList:
+def to_datetime(
+    date: StrOrIterable,
+    with_tz: bool = False,
+    tz_name: str = "Asia/Tokyo",
+    as_column: bool = False,
+    sample: int | None = None,
+    cache: ParseCache | None = None,
+    threads: int | None = None,
+) -> DatetimeOrList:
     """Parse and convert a given text to a datetime object.
 
-    * If it is failure to inffer a format in Japanese meaning, then parse text by dateutil.parser.
+    * If it is failure to inffer a format in Japanese meaning, then parse text by `parse_datetime_ja`,
+      which accepts 午前/午後, 正午, weekday annotations and 頃.
+      It also accepts a trailing zone designator such as JST, 日本時間, Z or +09:00.
+    * If it is also failure, then parse text by dateutil.parser.
+    * If `with_tz` = True, then naive results are given the timezone of `tz_name`, and results with
+      a zone designator are converted into it. So all results are normalized to one timezone.
     * If missing month or day digits in a text, then assign 1 as thier value.
+    * If `sample` is given for list-like texts, then a format is detected from a sample by `detect_format`
+      and only texts which fail to be parsed in it are inferred one by one. Multi formats are allowed in this mode.
+    * If `cache` is given, then results are memoized and each distinct text in list-like texts is parsed once.
+      Results are keyed by `sample` too, and the format rule above is checked over all distinct texts,
+      so cached calls succeed or fail as uncached ones. Only texts in one plain format are looked up
+      without parsing; other list-like texts are parsed as a whole and their results are not stored.
+    * If `threads` is given, then list-like texts are split into chunks and parsed by a thread pool.
+      The parsing engine takes no global locks on its hot path: a format is inferred once and compiled into
+      an immutable CompiledFormat shared by threads, and datetime.strptime is never called.
+      Texts in the extended grammar are parsed by chunks too, and their layouts are checked across chunks.
 
     Args:
         date (str): A date format text in Japanese style
         with_tz (bool): Whether or not append timezone from `tz_name` to datetime
         tz_name (str): Time zone name. This is valid if `with_tz` = True.
+        as_column (bool): Whether or not return a compact DatetimeColumn for list-like texts.
+                          If `with_tz` = False and results are aware, the column takes the tzinfo of the first result.
+                          Then naive and aware results cannot be mixed in either order.
+        sample (int or None): The sample size to detect a format of list-like texts
+        cache (ParseCache or None): A cache of parse results
+        threads (int or None): The number of threads to parse list-like texts
 
     Returns:
-        datetime.datetime or list[datetime.datetime]: Parsed datetime objects
+        datetime.datetime or list[datetime.datetime] or DatetimeColumn: Parsed datetime objects
 
     Raises:
         ValueError: If extsts multi formats in given texts
@@ -36,53 +269,47 @@ def to_datetime(date: StrOrIterable, with_tz: bool = False, tz_name: str = "Asia
 
     """
 
+    if cache is not None:
+        return _to_datetime_cached(date, with_tz, tz_name, as_column, sample, threads, cache)
+
     tz_obj = dateutil.tz.gettz(tz_name)
     out_obj: DatetimeOrList
 
     if isinstance(date, str):
-        try:
-            inferred_format = infer_dateformat_ja(date)
-        except ValueError:
-            inferred_format = None  # Imply not Japanese or invalid format
-
-        if inferred_format is not None:
-            dt_obj = datetime.strptime(date, inferred_format)
-        else:
-            dt_obj = dateutil.parser.parse(date)
+        dt_obj = _parse_one(date)
 
         if with_tz:
-            dt_obj = dt_obj.replace(tzinfo=tz_obj)
+            dt_obj = _attach_tz(dt_obj, tz_obj)
 
         out_obj = dt_obj
 
     elif isinstance(date, Iterable):
-        inferred_format_list = list()
-        try:
-            inferred_format_list += infer_dateformat_ja_all(date)
-            if len(inferred_format_list) != 1:
-                raise ValueError("Cannot infer ONE date-format")
-            inferred_format = inferred_format_list[0]
-        except ValueError:
-            inferred_format = None   # Imply not Japanese or invalid forma
+        if not isinstance(date, Sequence):
+            date = list(date)
 
-        out_obj = list()
-        for dtstr in date:
-            if inferred_format is not None:
-                dt_obj = datetime.strptime(dtstr, inferred_format)
-            else:
-                dt_obj = dateutil.parser.parse(dtstr)
+        parsed_list: Iterable[datetime]
+        if sample is not None:
+            parsed_list = _map_parse(_make_sampled_parse(date, sample), date, threads)
+        else:
+            inferred_format_list = list()
+            try:
+                inferred_format_list += _infer_formats(date, threads)
+            except ValueError:
+                pass  # Imply some texts are not in plain Japanese formats
 
-            if with_tz:
-                dt_obj = dt_obj.replace(tzinfo=tz_obj)
+            parsed_list = _parse_batch(date, inferred_format_list, threads)
+
+        if with_tz:
+            parsed_list = (_attach_tz(dt_obj, tz_obj) for dt_obj in parsed_list)
 
-            out_obj.append(dt_obj)
+        out_obj = _make_column(parsed_list, tz_obj if with_tz else None) if as_column else list(parsed_list)
     else:
         raise TypeError("Invalid type")
 
     return out_obj
 
 
-def to_date(date: StrOrIterable) -> DateOrList:
+def to_date(date: StrOrIterable, as_column: bool = False, cache: ParseCache | None = None) -> DateOrList:
     """Parse and convert a given text to a date object.
 
     * If it is failure to inffer a format in Japanese meaning, then parse text by dateutil.parser.
@@ -90,17 +317,21 @@ def to_date(date: StrOrIterable) -> DateOrList:
 
     Args:
         date (str): A date format text in Japanese style
+        as_column (bool): Whether or not return a lazy view over a DatetimeColumn for list-like texts
+        cache (ParseCache or None): A cache of parse results
 
     Returns:
-        datetime.date or list[datetime.date]: A parsed date object
+        datetime.date or list[datetime.date] or Sequence[datetime.date]: A parsed date object
 
     """
 
-    dt_obj = to_datetime(date)
+    dt_obj = to_datetime(date, as_column=as_column, cache=cache)
     out_obj: DateOrList
 
     if isinstance(dt_obj, datetime):
         out_obj = dt_obj.date()
+    elif isinstance(dt_obj, DatetimeColumn):
+        out_obj = dt_obj.dates()
     else:
         out_obj = list()
         for dt in dt_obj:
@@ -108,7 +339,7 @@ def to_date(date: StrOrIterable) -> DateOrList:
 
     return out_obj
 
-def to_time(date: StrOrIterable) -> TimeOrList:
+def to_time(date: StrOrIterable, as_column: bool = False, cache: ParseCache | None = None) -> TimeOrList:
     """Parse and convert a given text to a time object.
 
     * If it is failure to inffer a format in Japanese meaning, then parse text by dateutil.parser.
@@ -116,17 +347,21 @@ def to_time(date: StrOrIterable) -> TimeOrList:
 
     Args:
         text (str): A date format text in Japanese style
+        as_column (bool): Whether or not return a lazy view over a DatetimeColumn for list-like texts
+        cache (ParseCache or None): A cache of parse results
 
     Returns:
-        datetime.time or list[datetime.time]: A parsed date object
+        datetime.time or list[datetime.time] or Sequence[datetime.time]: A parsed date object
 
     """
 
-    dt_obj = to_datetime(date)
+    dt_obj = to_datetime(date, as_column=as_column, cache=cache)
     out_obj: TimeOrList
 
     if isinstance(dt_obj, datetime):
         out_obj = dt_obj.time()
+    elif isinstance(dt_obj, DatetimeColumn):
+        out_obj = dt_obj.times()
     else:
         out_obj = list()
         for dt in dt_obj:
@@ -17,6 +17,7 @@ setup(
     include_package_data=True,
     zip_safe=False,
     install_requires=_requires_from_file("requirements.txt"),
+    extras_require={"arrow": ["pyarrow"], "numpy": ["numpy"]},
     setup_requires=["pytest-runner"],
     tests_require=["pytest", "pytest-cov"]
 )
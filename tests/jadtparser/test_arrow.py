@@ -0,0 +1,113 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from datetime import datetime
+import dateutil.tz
+
+from jadtparser.arrow import parse_column, rewrite_parquet
+
+
+# ****************************
+# test parse_column
+# ****************************
+
+def test_parse_column_ja_ymdhm():
+    input_ = pa.array(["2022年10月30日9時30分", None, "2022年11月30日9時30分"])
+    excepted = [
+        datetime(2022, 10, 30, 9, 30, tzinfo=dateutil.tz.gettz("Asia/Tokyo")),
+        None,
+        datetime(2022, 11, 30, 9, 30, tzinfo=dateutil.tz.gettz("Asia/Tokyo")),
+    ]
+    result = parse_column(input_)
+    assert result.type == pa.timestamp("us", tz="Asia/Tokyo")
+    assert result.to_pylist() == excepted
+
+def test_parse_column_naive():
+    input_ = pa.array(["2022年10月30日"], type=pa.large_string())
+    excepted = [datetime(2022, 10, 30)]
+    result = parse_column(input_, tz_name=None)
+    assert result.type == pa.timestamp("us")
+    assert result.to_pylist() == excepted
+
+def test_parse_column_ja_microsecond():
+    input_ = pa.array(["2022年10月30日9時30分20.123456秒", None])
+    excepted = [datetime(2022, 10, 30, 9, 30, 20, 123456), None]
+    result = parse_column(input_, tz_name=None)
+    assert result.to_pylist() == excepted
+
+def test_parse_column_dictionary():
+    input_ = pa.array(["2022年10月30日", "2022年11月30日", "2022年10月30日"]).dictionary_encode()
+    excepted = [datetime(2022, 10, 30), datetime(2022, 11, 30), datetime(2022, 10, 30)]
+    result = parse_column(input_, tz_name=None)
+    assert result.to_pylist() == excepted
+
+def test_parse_column_notja():
+    input_ = pa.chunked_array([["20221030T093020"], ["20221130T093020"]])
+    excepted = [datetime(2022, 10, 30, 9, 30, 20), datetime(2022, 11, 30, 9, 30, 20)]
+    result = parse_column(input_, tz_name=None)
+    assert result.to_pylist() == excepted
+
+def test_parse_column_invalid_day_0229():
+    input_ = pa.array(["2022年2月29日", None])
+    with pytest.raises(ValueError):
+        parse_column(input_, tz_name=None)
+
+def test_parse_column_invalid_day_0431():
+    input_ = pa.array(["2022年4月30日9時", "2022年4月31日9時"])
+    with pytest.raises(ValueError):
+        parse_column(input_, tz_name=None)
+
+def test_parse_column_leap_day():
+    input_ = pa.array(["2024年2月29日", None])
+    excepted = [datetime(2024, 2, 29), None]
+    result = parse_column(input_, tz_name=None)
+    assert result.to_pylist() == excepted
+
+def test_parse_column_short_year():
+    input_ = pa.array(["22年10月30日", None])
+    with pytest.raises(ValueError):
+        parse_column(input_, tz_name=None)
+
+def test_parse_column_invalid_type():
+    with pytest.raises(TypeError):
+        parse_column(pa.array([1, 2]))
+
+
+# ****************************
+# test rewrite_parquet
+# ****************************
+
+def test_rewrite_parquet(tmp_path):
+    source = str(tmp_path / "source.parquet")
+    destination = str(tmp_path / "destination.parquet")
+    table = pa.table({
+        "id": [1, 2, 3],
+        "date": ["2022年10月30日", None, "2022年11月30日"],
+    })
+    pq.write_table(table, source)
+
+    rewrite_parquet(source, destination, ["date"], tz_name=None, batch_size=2)
+    result = pq.read_table(destination)
+    assert result.column("id").to_pylist() == [1, 2, 3]
+    assert result.column("date").to_pylist() == [datetime(2022, 10, 30), None, datetime(2022, 11, 30)]
+
+def test_rewrite_parquet_required_column(tmp_path):
+    source = str(tmp_path / "source.parquet")
+    destination = str(tmp_path / "destination.parquet")
+    schema = pa.schema([pa.field("id", pa.int64(), nullable=False), pa.field("date", pa.string())])
+    table = pa.table({"id": [1, 2, 3], "date": ["2022年10月30日", None, "2022年11月30日"]}, schema=schema)
+    pq.write_table(table, source)
+
+    rewrite_parquet(source, destination, ["date"], tz_name=None, batch_size=2)
+    result = pq.read_table(destination)
+    assert not result.schema.field("id").nullable
+    assert result.column("id").to_pylist() == [1, 2, 3]
+    assert result.column("date").to_pylist() == [datetime(2022, 10, 30), None, datetime(2022, 11, 30)]
+
+def test_rewrite_parquet_missing_column(tmp_path):
+    source = str(tmp_path / "source.parquet")
+    pq.write_table(pa.table({"id": [1]}), source)
+    with pytest.raises(KeyError):
+        rewrite_parquet(source, str(tmp_path / "destination.parquet"), ["date"])
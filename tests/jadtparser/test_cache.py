@@ -0,0 +1,139 @@
+import pytest
+import jadtparser
+
+from datetime import datetime, date
+import dateutil.parser
+import dateutil.tz
+
+
+# ****************************
+# test ParseCache
+# ****************************
+
+def test_cache_lru_eviction():
+    cache = jadtparser.ParseCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == jadtparser.CacheInfo(hits=3, misses=1, maxsize=2, currsize=2)
+
+def test_cache_clear():
+    cache = jadtparser.ParseCache()
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+    assert cache.info() == jadtparser.CacheInfo(hits=0, misses=0, maxsize=cache.maxsize, currsize=0)
+
+def test_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        jadtparser.ParseCache(maxsize=0)
+
+
+# ****************************
+# test cached converters
+# ****************************
+
+def test_to_datetime_cache():
+    cache = jadtparser.ParseCache()
+    input_ = "2022年10月30日9時30分20秒"
+    excepted = datetime(2022, 10, 30, 9, 30, 20)
+    assert jadtparser.to_datetime(input_, cache=cache) == excepted
+    assert jadtparser.to_datetime(input_, cache=cache) == excepted
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_to_datetime_cache_tz_settings():
+    cache = jadtparser.ParseCache()
+    input_ = "2022年10月30日9時30分20秒"
+    naive = jadtparser.to_datetime(input_, cache=cache)
+    aware = jadtparser.to_datetime(input_, with_tz=True, cache=cache)
+    assert naive.tzinfo is None
+    assert aware.tzinfo == dateutil.tz.gettz("Asia/Tokyo")
+
+def test_to_datetime_cache_list_dedup():
+    cache = jadtparser.ParseCache()
+    input_ = [
+        "2022年10月30日9時30分20秒",
+        "2022年10月30日9時30分20秒",
+        "2022年11月30日9時30分20秒",
+    ]
+    excepted = [
+        datetime(2022, 10, 30, 9, 30, 20),
+        datetime(2022, 10, 30, 9, 30, 20),
+        datetime(2022, 11, 30, 9, 30, 20),
+    ]
+    result = jadtparser.to_datetime(input_, cache=cache)
+    assert result == excepted
+    assert (cache.hits, cache.misses) == (0, 2)
+    result = jadtparser.to_datetime(input_, cache=cache, as_column=True)
+    assert result == excepted
+    assert (cache.hits, cache.misses) == (2, 2)
+
+def test_to_datetime_cache_multi_formats():
+    cache = jadtparser.ParseCache()
+    input_ = ["2022年10月30日", "2022/10/30"]
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_)
+    jadtparser.to_datetime(input_[0], cache=cache)
+    jadtparser.to_datetime(input_[1:], cache=cache)
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_, cache=cache)
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_[:1] + ["2022年10月31日", "2022/10/30"], cache=cache)
+
+def test_to_datetime_cache_extended():
+    cache = jadtparser.ParseCache()
+    input_ = ["2022年10月30日午後3時", "2022年10月30日午後3時"]
+    excepted = [datetime(2022, 10, 30, 15), datetime(2022, 10, 30, 15)]
+    assert jadtparser.to_datetime(input_, cache=cache) == excepted
+    assert jadtparser.to_datetime(input_, cache=cache) == excepted
+
+def test_to_datetime_cache_sample_key():
+    cache = jadtparser.ParseCache()
+    input_ = ["2022年10月30日", "2022/10/30"]
+    excepted = [datetime(2022, 10, 30), datetime(2022, 10, 30)]
+    assert jadtparser.to_datetime(input_, sample=2, cache=cache) == excepted
+    assert len(cache) == 2
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_, cache=cache)
+
+@pytest.mark.filterwarnings("ignore::dateutil.parser.UnknownTimezoneWarning")
+def test_to_datetime_cache_mixed_layouts_then_single():
+    cache = jadtparser.ParseCache()
+    input_ = ["2022/11/01 09:30 JST", "2022-11-01T00:30Z"]
+    assert jadtparser.to_datetime(input_, cache=cache) == jadtparser.to_datetime(input_)
+    result = jadtparser.to_datetime(input_[0], cache=cache)
+    assert result == jadtparser.to_datetime(input_[0])
+    assert result.tzinfo is not None
+
+def test_to_datetime_cache_infer_once(monkeypatch):
+    calls = list()
+    infer = jadtparser.parser.infer_dateformat_ja
+    for module in (jadtparser.parser, jadtparser.type_converter):
+        monkeypatch.setattr(module, "infer_dateformat_ja", lambda t: calls.append(t) or infer(t))
+    cache = jadtparser.ParseCache()
+    input_ = ["2022年10月30日", "2022年10月31日", "2022年10月30日"]
+    excepted = [datetime(2022, 10, 30), datetime(2022, 10, 31), datetime(2022, 10, 30)]
+    assert jadtparser.to_datetime(input_, cache=cache) == excepted
+    assert len(calls) == 2
+    assert len(cache) == 2
+
+def test_to_date_cache():
+    cache = jadtparser.ParseCache()
+    input_ = ["2022年10月30日", "2022年10月30日"]
+    excepted = [date(2022, 10, 30), date(2022, 10, 30)]
+    result = jadtparser.to_date(input_, cache=cache)
+    assert result == excepted
+    assert len(cache) == 1
+
+def test_date_add_cache():
+    cache = jadtparser.ParseCache()
+    input_dt = "2022年10月30日"
+    excepted = "2022年11月02日"
+    assert jadtparser.date_add(input_dt, 3, cache=cache) == excepted
+    assert jadtparser.date_add(input_dt, 3, cache=cache) == excepted
+    assert jadtparser.date_sub(input_dt, 3, cache=cache) == "2022年10月27日"
+    assert (cache.hits, cache.misses) == (1, 2)
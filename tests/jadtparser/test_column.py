@@ -0,0 +1,132 @@
+import pytest
+import jadtparser
+
+from datetime import datetime, date, time
+import dateutil.tz
+
+
+# ****************************
+# test DatetimeColumn
+# ****************************
+
+def test_column_roundtrip():
+    input_ = [
+        datetime(2022, 10, 30, 9, 30, 20, 123456),
+        datetime(1960, 1, 1),
+    ]
+    result = jadtparser.DatetimeColumn(input_)
+    assert len(result) == 2
+    assert result[0] == input_[0]
+    assert result[-1] == input_[1]
+    assert list(result) == input_
+
+def test_column_withtz():
+    tz = dateutil.tz.gettz("Asia/Tokyo")
+    input_ = [datetime(2022, 10, 30, 9, 30, 20)]
+    excepted = datetime(2022, 10, 30, 9, 30, 20, 0, tz)
+    result = jadtparser.DatetimeColumn(input_, tzinfo=tz)
+    assert result[0] == excepted
+    assert result[0].utcoffset() == excepted.utcoffset()
+
+def test_column_naive_rejects_aware():
+    column = jadtparser.DatetimeColumn()
+    with pytest.raises(ValueError):
+        column.append(datetime(2022, 10, 30, tzinfo=dateutil.tz.gettz("UTC")))
+
+def test_column_sort_min_max():
+    input_ = [datetime(2022, 11, 30), datetime(2022, 10, 30), datetime(2022, 12, 30)]
+    column = jadtparser.DatetimeColumn(input_)
+    assert column.min() == datetime(2022, 10, 30)
+    assert column.max() == datetime(2022, 12, 30)
+    column.sort()
+    assert list(column) == sorted(input_)
+    column.sort(reverse=True)
+    assert list(column) == sorted(input_, reverse=True)
+
+def test_column_sort_then_extend():
+    input_ = [datetime(2022, 11, 30), datetime(2022, 10, 30), datetime(2022, 11, 30), datetime(1969, 12, 31)]
+    column = jadtparser.DatetimeColumn(input_)
+    column.sort(reverse=True)
+    assert list(column) == sorted(input_, reverse=True)
+    column.append(datetime(2023, 1, 1))
+    column.sort()
+    assert list(column) == sorted(input_ + [datetime(2023, 1, 1)])
+
+def test_column_projections():
+    column = jadtparser.DatetimeColumn([datetime(2022, 10, 30, 9, 30, 20)])
+    assert column.dates() == [date(2022, 10, 30)]
+    assert column.times() == [time(9, 30, 20)]
+
+def test_column_slice():
+    input_ = [datetime(2022, 10, 30), datetime(2022, 11, 30), datetime(2022, 12, 30)]
+    column = jadtparser.DatetimeColumn(input_)
+    result = column[1:]
+    assert isinstance(result, jadtparser.DatetimeColumn)
+    assert result == input_[1:]
+
+def test_column_buffer():
+    column = jadtparser.DatetimeColumn([datetime(1970, 1, 1, 0, 0, 1)])
+    view = column.epoch_microseconds
+    assert view.format == "q"
+    assert view.tolist() == [1_000_000]
+
+
+# ****************************
+# test as_column
+# ****************************
+
+def test_to_datetime_as_column():
+    input_ = [
+        "2022年10月30日9時30分20秒",
+        "2022年11月30日9時30分20秒"
+    ]
+    excepted = [
+        datetime(2022, 10, 30, 9, 30, 20, 0),
+        datetime(2022, 11, 30, 9, 30, 20, 0),
+    ]
+    result = jadtparser.to_datetime(input_, as_column=True)
+    assert isinstance(result, jadtparser.DatetimeColumn)
+    assert result == excepted
+
+def test_to_datetime_as_column_withtz():
+    input_ = ["2022年10月30日9時30分20秒"]
+    excepted = [datetime(2022, 10, 30, 9, 30, 20, 0, dateutil.tz.gettz("Asia/Tokyo"))]
+    result = jadtparser.to_datetime(input_, with_tz=True, as_column=True)
+    assert result == excepted
+
+def test_to_datetime_as_column_aware():
+    input_ = ["2022/11/01 09:30+09:00", "2022/11/01 10:30+09:00"]
+    excepted = [
+        datetime(2022, 11, 1, 9, 30, tzinfo=dateutil.tz.tzoffset(None, 9 * 3600)),
+        datetime(2022, 11, 1, 10, 30, tzinfo=dateutil.tz.tzoffset(None, 9 * 3600)),
+    ]
+    result = jadtparser.to_datetime(input_, as_column=True)
+    assert result.tzinfo is not None
+    assert result == excepted
+    assert jadtparser.to_datetime(input_, as_column=True, cache=jadtparser.ParseCache()) == excepted
+
+@pytest.mark.parametrize("input_", [
+    ["2022/11/01 09:30+09:00", "2022/11/01 10:30"],
+    ["2022/11/01 10:30", "2022/11/01 09:30+09:00"],
+])
+def test_to_datetime_as_column_mixed_aware(input_):
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_, as_column=True)
+
+def test_to_date_as_column():
+    input_ = [
+        "2022年10月30日9時30分20秒",
+        "2022年11月30日9時30分20秒"
+    ]
+    excepted = [date(2022, 10, 30), date(2022, 11, 30)]
+    result = jadtparser.to_date(input_, as_column=True)
+    assert result == excepted
+
+def test_to_time_as_column():
+    input_ = [
+        "2022年10月30日9時30分20秒",
+        "2022年11月30日10時30分20秒"
+    ]
+    excepted = [time(9, 30, 20), time(10, 30, 20)]
+    result = jadtparser.to_time(input_, as_column=True)
+    assert result == excepted
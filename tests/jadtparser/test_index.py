@@ -0,0 +1,112 @@
+import pytest
+import jadtparser
+
+from datetime import datetime
+import dateutil.tz
+
+
+# ****************************
+# test TimeIndex
+# ****************************
+
+def _make_index():
+    input_ = [
+        "2022年11月3日9時30分",
+        "2022年11月1日9時30分",
+        "2022年11月2日10時15分",
+        "2022年11月1日9時30分",
+        "2022年11月30日23時00分",
+    ]
+    return jadtparser.TimeIndex(input_)
+
+def test_time_index_between():
+    index = _make_index()
+    excepted = [1, 3, 2, 0]
+    result = index.between("2022年11月1日", "2022年11月3日9時30分")
+    assert result == excepted
+
+def test_time_index_between_exclusive():
+    index = _make_index()
+    excepted = [1, 3, 2]
+    result = index.between("2022年11月1日", "2022年11月3日9時30分", inclusive=False)
+    assert result == excepted
+
+def test_time_index_between_datetime():
+    index = _make_index()
+    excepted = [4]
+    result = index.between(datetime(2022, 11, 4), datetime(2022, 12, 1))
+    assert result == excepted
+
+def test_time_index_nearest():
+    index = _make_index()
+    assert index.nearest("2022年11月2日9時") == 2
+    assert index.nearest("2022年10月1日") == 1
+    assert index.nearest("2022年12月1日") == 4
+
+def test_time_index_nearest_empty():
+    with pytest.raises(ValueError):
+        jadtparser.TimeIndex().nearest("2022年11月1日")
+
+def test_time_index_resample_hour():
+    index = _make_index()
+    excepted = {
+        datetime(2022, 11, 1, 9): 2,
+        datetime(2022, 11, 2, 10): 1,
+        datetime(2022, 11, 3, 9): 1,
+        datetime(2022, 11, 30, 23): 1,
+    }
+    result = index.resample("hour")
+    assert result == excepted
+    assert list(result) == sorted(excepted)
+
+def test_time_index_resample_month():
+    index = _make_index()
+    excepted = {datetime(2022, 11, 1): 5}
+    result = index.resample("month")
+    assert result == excepted
+
+def test_time_index_resample_withtz():
+    tz = dateutil.tz.gettz("Asia/Tokyo")
+    index = jadtparser.TimeIndex(["2022年11月1日9時30分", "2022年11月1日23時30分"], with_tz=True)
+    excepted = {datetime(2022, 11, 1, tzinfo=tz): 2}
+    result = index.resample("day")
+    assert result == excepted
+
+def test_time_index_resample_invalid_unit():
+    with pytest.raises(ValueError):
+        _make_index().resample("week")
+
+def test_time_index_extend():
+    index = _make_index()
+    index.extend(["2022年12月1日", "2022年11月2日"])
+    index.append("2022年11月1日9時30分")
+    assert len(index) == 8
+    assert index.between("2022年11月1日", "2022年11月2日") == [1, 3, 7, 6]
+    assert index.nearest("2022年12月2日") == 5
+
+def test_time_index_aware():
+    index = jadtparser.TimeIndex(["2022/11/01 10:30+09:00", "2022/11/01 09:30+09:00"])
+    assert index.between("2022/11/01 00:00Z", "2022/11/01 01:30Z") == [1, 0]
+    assert index.resample("hour") == {
+        datetime(2022, 11, 1, 9, tzinfo=dateutil.tz.tzoffset(None, 9 * 3600)): 1,
+        datetime(2022, 11, 1, 10, tzinfo=dateutil.tz.tzoffset(None, 9 * 3600)): 1,
+    }
+
+def test_time_index_aware_naive_texts():
+    index = jadtparser.TimeIndex(["2022/11/01 10:30+09:00", "2022/11/01 09:30+09:00"])
+    assert index.between("2022年11月1日9時", "2022年11月1日10時") == [1]
+    index.append("2022年11月1日9時45分")
+    assert index.between("2022年11月1日9時", "2022年11月1日10時") == [1, 2]
+    assert index.between("2022/11/01 00:00Z", "2022/11/01 01:00Z") == [1, 2]
+
+def test_time_index_naive_aware_texts():
+    index = _make_index()
+    with pytest.raises(ValueError):
+        index.between("2022/11/01 00:00Z", "2022/11/01 01:00Z")
+    with pytest.raises(ValueError):
+        index.append("2022/11/01 09:30+09:00")
+
+def test_time_index_extend_aware_empty():
+    index = jadtparser.TimeIndex()
+    index.extend(["2022/11/01 09:30+09:00"])
+    assert index.between("2022/11/01 00:00Z", "2022/11/01 01:00Z") == [0]
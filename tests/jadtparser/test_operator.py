@@ -127,3 +127,71 @@ def test_date_diff_relative():
     excepted = relativedelta(days=3)
     result = jadtparser.date_diff(input_date1, input_date2, relative=True)
     assert result == excepted
+
+
+# ****************************
+# test date_range
+# ****************************
+
+def test_date_range_ja_ymd():
+    excepted = ["2022年12月30日", "2022年12月31日", "2023年01月01日"]
+    result = jadtparser.date_range("2022年12月30日", "2023年1月1日")
+    assert list(result) == excepted
+
+def test_date_range_ja_ymd_step():
+    excepted = ["2022年10月01日", "2022年10月04日"]
+    result = jadtparser.date_range("2022年10月1日", "2022年10月6日", step=3)
+    assert list(result) == excepted
+
+def test_date_range_ja_ymdh_unit_hour():
+    excepted = ["2022年12月31日22時", "2023年01月01日00時", "2023年01月01日02時"]
+    result = jadtparser.date_range("2022年12月31日22時", "2023年1月1日2時", step=2, unit="hour")
+    assert list(result) == excepted
+
+def test_date_range_ja_ymd_unit_hour_end_ymdh():
+    excepted = [datetime(2022, 10, 1, h) for h in range(4)]
+    result = jadtparser.date_range("2022年10月1日", "2022年10月1日3時", unit="hour", convert_dt=True)
+    assert list(result) == excepted
+
+def test_date_range_ja_ymd_unit_hour_str():
+    with pytest.raises(ValueError):
+        jadtparser.date_range("2022年1月1日", "2022年1月2日", unit="hour")
+
+def test_date_range_ja_ymdh_unit_hour_end_ymd():
+    excepted = ["2022年09月30日22時", "2022年09月30日23時", "2022年10月01日00時"]
+    result = jadtparser.date_range("2022年9月30日22時", "2022年10月1日", unit="hour")
+    assert list(result) == excepted
+
+def test_date_range_ja_ymd_end_other_format():
+    excepted = ["2022年10月01日", "2022年10月02日", "2022年10月03日"]
+    result = jadtparser.date_range("2022年10月1日", "2022/10/3")
+    assert list(result) == excepted
+
+def test_date_range_ja_ymd_unit_month():
+    excepted = ["2022年01月31日", "2022年02月28日", "2022年03月31日"]
+    result = jadtparser.date_range("2022年1月31日", "2022年3月31日", unit="month")
+    assert list(result) == excepted
+
+def test_date_range_ja_ymd_backward():
+    excepted = [datetime(2022, 1, 3), datetime(2022, 1, 2), datetime(2022, 1, 1)]
+    result = jadtparser.date_range("2022年1月3日", "2022年1月1日", step=-1, convert_dt=True)
+    assert list(result) == excepted
+
+def test_date_range_matches_strftime():
+    fmt = "%Y年%m月%d日%H時%M分"
+    start = datetime(2020, 2, 27, 23, 50)
+    excepted = [(start + timedelta(minutes=7 * i)).strftime(fmt) for i in range(500)]
+    result = jadtparser.date_range(excepted[0], excepted[-1], step=7, unit="minute")
+    assert list(result) == excepted
+
+def test_date_range_zero_step():
+    with pytest.raises(ValueError):
+        jadtparser.date_range("2022年10月1日", "2022年10月6日", step=0)
+
+def test_date_range_unit_invalid():
+    with pytest.raises(ValueError):
+        jadtparser.date_range("2022年10月1日", "2022年10月6日", unit="quarter")
+
+def test_date_range_notja():
+    with pytest.raises(ValueError):
+        jadtparser.date_range("20221001", "20221006")
@@ -1,6 +1,8 @@
 import pytest
 import jadtparser
 
+from datetime import datetime, timedelta, timezone
+
 
 # ****************************
 # test infer_dateformat_ja
@@ -87,7 +89,162 @@ def test_infer_dateformat_ja_ymdhms_invalid_s():
     with pytest.raises(ValueError):
         jadtparser.infer_dateformat_ja(input_)
 
+def test_infer_dateformat_ja_too_many_fields():
+    input_ = "2022-11-01T09:30:00.123+09:00"
+    with pytest.raises(ValueError):
+        jadtparser.infer_dateformat_ja(input_)
+
 def test_infer_dateformat_ja_ymdhms_invalid_microsecond():
     input_ = "2022年10月30日9時30分20秒000000ミリ秒"
     with pytest.raises(ValueError):
         jadtparser.infer_dateformat_ja(input_)
+
+
+# ****************************
+# test parse_datetime_ja
+# ****************************
+def test_parse_datetime_ja_pm_weekday_approximate():
+    input_ = "2022年11月1日(火) 午後3時30分頃"
+    excepted = jadtparser.ParsedDatetime(datetime(2022, 11, 1, 15, 30), True)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result == excepted
+
+def test_parse_datetime_ja_am_twelve():
+    input_ = "2022年11月1日火曜日 午前12時"
+    excepted = jadtparser.ParsedDatetime(datetime(2022, 11, 1, 0, 0), False)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result == excepted
+
+def test_parse_datetime_ja_noon():
+    input_ = "2022年11月1日 正午"
+    excepted = datetime(2022, 11, 1, 12, 0)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+
+def test_parse_datetime_ja_slash_weekday():
+    input_ = "2022/11/01（火）15:30"
+    excepted = datetime(2022, 11, 1, 15, 30)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+
+def test_parse_datetime_ja_weekday_mismatch():
+    input_ = "2022年11月1日(水)"
+    with pytest.raises(ValueError):
+        jadtparser.parse_datetime_ja(input_)
+
+def test_parse_datetime_ja_pm_invalid_hour():
+    input_ = "2022年11月1日 午後13時"
+    with pytest.raises(ValueError):
+        jadtparser.parse_datetime_ja(input_)
+
+def test_parse_datetime_ja_qualifier_not_last():
+    input_ = "2022年11月1日頃9時"
+    with pytest.raises(ValueError):
+        jadtparser.parse_datetime_ja(input_)
+
+def test_parse_datetime_ja_notja():
+    input_ = "20221030T093020"
+    with pytest.raises(ValueError):
+        jadtparser.parse_datetime_ja(input_)
+
+def test_parse_datetime_ja_zone_name():
+    input_ = "2022年11月1日9時30分 JST"
+    excepted = datetime(2022, 11, 1, 9, 30, tzinfo=timezone(timedelta(hours=9)))
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+    assert result.value.utcoffset() == timedelta(hours=9)
+
+def test_parse_datetime_ja_zone_ja():
+    input_ = "2022年11月1日9時30分（日本時間）"
+    excepted = datetime(2022, 11, 1, 0, 30, tzinfo=timezone.utc)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+
+def test_parse_datetime_ja_zone_offset():
+    input_ = "2022/11/01 09:30+09:00"
+    excepted = datetime(2022, 11, 1, 9, 30, tzinfo=timezone(timedelta(hours=9)))
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+    assert result.value.utcoffset() == timedelta(hours=9)
+
+def test_parse_datetime_ja_zone_z():
+    input_ = "2022-11-01T00:30Z"
+    excepted = datetime(2022, 11, 1, 0, 30, tzinfo=timezone.utc)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+
+def test_parse_datetime_ja_hyphen_day_not_offset():
+    input_ = "2022-11-01"
+    excepted = datetime(2022, 11, 1)
+    result = jadtparser.parse_datetime_ja(input_)
+    assert result.value == excepted
+    assert result.value.tzinfo is None
+
+def test_parse_datetime_ja_zone_invalid_offset():
+    input_ = "2022/11/01 09:30+25:00"
+    with pytest.raises(ValueError):
+        jadtparser.parse_datetime_ja(input_)
+
+def test_parse_datetime_ja_all_multilayouts():
+    input_ = ["2022年11月1日 午後3時", "2022/11/02 午後3時"]
+    with pytest.raises(ValueError):
+        jadtparser.parse_datetime_ja_all(input_)
+
+
+# ****************************
+# test compile_dateformat
+# ****************************
+def test_compile_dateformat_ymdhmf():
+    input_ = "2022年10月30日9時30分20.5秒"
+    excepted = datetime(2022, 10, 30, 9, 30, 20, 500000)
+    result = jadtparser.compile_dateformat("%Y年%m月%d日%H時%M分%S.%f秒").parse(input_)
+    assert result == excepted
+
+def test_compile_dateformat_ym():
+    input_ = "2022/10/"
+    excepted = datetime(2022, 10, 1)
+    result = jadtparser.compile_dateformat("%Y/%m/").parse(input_)
+    assert result == excepted
+
+def test_compile_dateformat_mismatch():
+    with pytest.raises(ValueError):
+        jadtparser.compile_dateformat("%Y年%m月%d日").parse("2022/10/30")
+
+def test_compile_dateformat_invalid_value():
+    with pytest.raises(ValueError):
+        jadtparser.compile_dateformat("%Y年%m月%d日").parse("2022年13月30日")
+
+def test_compile_dateformat_unsupported():
+    with pytest.raises(ValueError):
+        jadtparser.compile_dateformat("%Y年%b")
+
+
+# ****************************
+# test detect_format
+# ****************************
+def test_detect_format():
+    input_ = ["2022年10月30日"] * 90 + ["2022/10/30 "] * 10
+    result = jadtparser.detect_format(input_, sample=100)
+    assert result.format == "%Y年%m月%d日"
+    assert result.compiled.format == "%Y年%m月%d日"
+    assert result.confidence == 0.9
+    assert result.frequencies == {"%Y年%m月%d日": 90, "%Y/%m/%d ": 10}
+    assert result.sample_size == 100
+
+def test_detect_format_sampled():
+    input_ = (f"2022年10月{d % 28 + 1}日" for d in range(10000))
+    result = jadtparser.detect_format(input_, sample=50, seed=0)
+    assert result.format == "%Y年%m月%d日"
+    assert result.confidence == 1.0
+    assert result.sample_size == 50
+
+def test_detect_format_notja():
+    input_ = ["20221030T093020"]
+    result = jadtparser.detect_format(input_)
+    assert result.format is None
+    assert result.compiled is None
+    assert result.confidence == 0.0
+
+def test_detect_format_invalid_sample():
+    with pytest.raises(ValueError):
+        jadtparser.detect_format(["2022年10月30日"], sample=0)
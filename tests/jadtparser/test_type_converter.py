@@ -1,7 +1,7 @@
 import pytest
 import jadtparser
 
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
 import dateutil.tz
 
 
@@ -71,6 +71,103 @@ def test_to_datetime_ja_ymdhms_list_multifmts():
     with pytest.raises(ValueError):
         jadtparser.to_datetime(input_)
 
+def test_to_datetime_ja_extended():
+    input_ = "2022年11月1日(火) 午後3時30分頃"
+    excepted = datetime(2022, 11, 1, 15, 30)
+    result = jadtparser.to_datetime(input_)
+    assert result == excepted
+
+def test_to_datetime_ja_extended_list():
+    input_ = [
+        "2022年11月1日 午前9時30分",
+        "2022年11月1日 午後9時30分"
+    ]
+    excepted = [
+        datetime(2022, 11, 1, 9, 30),
+        datetime(2022, 11, 1, 21, 30),
+    ]
+    result = jadtparser.to_datetime(input_)
+    assert result == excepted
+
+def test_to_datetime_ja_sample():
+    input_ = [
+        "2022年10月30日9時30分20秒",
+        "2022年11月30日9時30分20秒",
+        "2022年12月30日 午後9時30分",
+    ]
+    excepted = [
+        datetime(2022, 10, 30, 9, 30, 20, 0),
+        datetime(2022, 11, 30, 9, 30, 20, 0),
+        datetime(2022, 12, 30, 21, 30, 0, 0),
+    ]
+    result = jadtparser.to_datetime(input_, sample=2)
+    assert result == excepted
+
+def test_to_datetime_ja_sample_generator():
+    input_ = (f"2022年10月{d}日" for d in range(1, 4))
+    excepted = [datetime(2022, 10, d) for d in range(1, 4)]
+    result = jadtparser.to_datetime(input_, sample=10)
+    assert result == excepted
+
+def test_to_datetime_ja_threads():
+    input_ = [f"2022年10月{d}日9時30分20秒" for d in range(1, 31)]
+    excepted = [datetime(2022, 10, d, 9, 30, 20) for d in range(1, 31)]
+    result = jadtparser.to_datetime(input_, threads=4)
+    assert result == excepted
+
+def test_to_datetime_ja_threads_sample():
+    input_ = [f"2022年10月{d}日" for d in range(1, 31)] + ["2022/11/01 "]
+    excepted = [datetime(2022, 10, d) for d in range(1, 31)] + [datetime(2022, 11, 1)]
+    result = jadtparser.to_datetime(input_, sample=10, threads=3)
+    assert result == excepted
+
+def test_to_datetime_ja_threads_multifmts():
+    input_ = [
+        "2022年10月30日9時30分20秒",
+        "2022年11月30日9:30:20"
+    ]
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_, threads=2)
+
+def test_to_datetime_ja_threads_extended():
+    input_ = [f"2022年10月{d}日午後3時" for d in range(1, 31)]
+    excepted = [datetime(2022, 10, d, 15) for d in range(1, 31)]
+    result = jadtparser.to_datetime(input_, threads=3)
+    assert result == excepted
+
+def test_to_datetime_ja_threads_extended_multi_layouts():
+    input_ = ["2022年10月1日午後3時", "2022年10月2日午後3時", "2022/10/3 午後3時", "2022/10/4 午後3時"]
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_)
+    with pytest.raises(ValueError):
+        jadtparser.to_datetime(input_, threads=2)
+
+def test_to_datetime_ja_zone_normalize():
+    input_ = [
+        "2022/11/01 09:30+09:00",
+        "2022/11/01 00:30Z",
+    ]
+    excepted = [
+        datetime(2022, 11, 1, 9, 30, tzinfo=dateutil.tz.gettz("Asia/Tokyo")),
+        datetime(2022, 11, 1, 9, 30, tzinfo=dateutil.tz.gettz("Asia/Tokyo")),
+    ]
+    result = jadtparser.to_datetime(input_, with_tz=True)
+    assert result == excepted
+    assert all(dt.tzinfo == dateutil.tz.gettz("Asia/Tokyo") for dt in result)
+
+def test_to_datetime_rfc3339_microsecond_offset():
+    input_ = "2022-11-01T09:30:00.123456+09:00"
+    excepted = datetime(2022, 11, 1, 0, 30, 0, 123456, dateutil.tz.UTC)
+    result = jadtparser.to_datetime(input_)
+    assert result == excepted
+    assert result.utcoffset() == timedelta(hours=9)
+
+def test_to_datetime_rfc3339_fraction_z():
+    input_ = "2022-11-01T09:30:00.5Z"
+    excepted = datetime(2022, 11, 1, 9, 30, 0, 500000, dateutil.tz.UTC)
+    result = jadtparser.to_datetime(input_)
+    assert result == excepted
+
 def test_to_datetime_invalid():
     input_ = "二〇二二年十月三〇日"
     with pytest.raises(ValueError):